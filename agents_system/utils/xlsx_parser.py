@@ -1,10 +1,26 @@
 import pandas as pd
 from typing import Dict, List, Any, Tuple
 import os
+import re
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 用于过滤说明性文字的关键词，包含这些关键词的单元格不视为违禁词
+_NON_WORD_KEYWORDS = ('说明', '原理', '平替词', '替代词', '禁用原理', 'NaN', 'Unnamed', '违禁词', '改写方案')
+
+# 工作表名转换为文件名时需要去除的字符（字母、数字、下划线、空格和连字符以外的字符）
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\- ]')
+
+
+def _cell_text(value: Any) -> str:
+    """
+    将单元格的值转换为去除首尾空白的字符串，空值返回空字符串
+    """
+    if pd.isna(value):
+        return ''
+    return str(value).strip()
+
 
 class XLSXParser:
     """
@@ -53,45 +69,33 @@ class XLSXParser:
             # 解析违禁词数据
             prohibited_words = []
             
-            # 跳过标题行（第一行）
-            for index, row in df.iterrows():
-                # 跳过标题行
-                if index == 0:
-                    continue
-                    
+            # 跳过标题行（第一行），并一次性转换为ndarray，避免逐行构造Series
+            column_count = len(df.columns)
+            rows = df.iloc[1:, :3].to_numpy(dtype=object)
+            
+            for index, row in enumerate(rows, start=1):
                 try:
                     # 根据工作表的列数采用不同的解析策略
-                    if len(df.columns) >= 3:
-                        # 对于3列及以上的工作表，第3列通常是违禁词列
-                        if len(row) >= 3 and pd.notna(row[2]) and str(row[2]).strip() != "":
-                            sensitive_word = str(row[2]).strip()
-                            
-                            # 过滤掉明显不是违禁词的内容
-                            if not any(keyword in sensitive_word for keyword in 
-                                     ['说明', '原理', '平替词', '替代词', '禁用原理', 'NaN', 'Unnamed', '违禁词', '改写方案']):
-                                word_info = {
-                                    'sensitive_word': sensitive_word,
-                                    'replacement': '***',  # 默认替换词
-                                    'level': 1,  # 默认级别
-                                    'comment': str(row[1]).strip() if len(row) > 1 and pd.notna(row[1]) else ''  # 第2列为类别/备注
-                                }
-                                prohibited_words.append(word_info)
-                                
-                    elif len(df.columns) == 2:
-                        # 对于2列的工作表，第2列可能是违禁词列
-                        if len(row) >= 2 and pd.notna(row[1]) and str(row[1]).strip() != "":
-                            sensitive_word = str(row[1]).strip()
-                            
-                            # 过滤掉明显不是违禁词的内容
-                            if not any(keyword in sensitive_word for keyword in 
-                                     ['说明', '原理', '平替词', '替代词', '禁用原理', 'NaN', 'Unnamed', '违禁词', '改写方案']):
-                                word_info = {
-                                    'sensitive_word': sensitive_word,
-                                    'replacement': '***',  # 默认替换词
-                                    'level': 1,  # 默认级别
-                                    'comment': str(row[0]).strip() if len(row) > 0 and pd.notna(row[0]) else ''  # 第1列为类别/备注
-                                }
-                                prohibited_words.append(word_info)
+                    if column_count >= 3:
+                        # 对于3列及以上的工作表，第3列通常是违禁词列，第2列为类别/备注
+                        _, comment_cell, word_cell = row
+                    elif column_count == 2:
+                        # 对于2列的工作表，第2列可能是违禁词列，第1列为类别/备注
+                        comment_cell, word_cell = row
+                    else:
+                        continue
+                    
+                    sensitive_word = _cell_text(word_cell)
+                    
+                    # 过滤掉空值和明显不是违禁词的内容
+                    if sensitive_word and not any(keyword in sensitive_word for keyword in _NON_WORD_KEYWORDS):
+                        word_info = {
+                            'sensitive_word': sensitive_word,
+                            'replacement': '***',  # 默认替换词
+                            'level': 1,  # 默认级别
+                            'comment': _cell_text(comment_cell)
+                        }
+                        prohibited_words.append(word_info)
                                 
                 except (ValueError, KeyError, IndexError) as e:
                     self.logger.warning(f"工作表 {sheet_name} 第 {index+1} 行数据解析失败: {e}")
@@ -144,7 +148,7 @@ class XLSXParser:
         # 为每个工作表创建一个文本文件
         for sheet_name, words in parsed_data.items():
             # 清理文件名中的非法字符
-            safe_sheet_name = "".join(c for c in sheet_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            safe_sheet_name = _UNSAFE_FILENAME_CHARS.sub('', sheet_name).rstrip()
             file_name = f"{safe_sheet_name}.txt"
             file_path = os.path.join(output_dir, file_name)
             